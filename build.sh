@@ -6,19 +6,25 @@ git fetch --unshallow
 
 echo "=== Building tools.simonwillison.net for Cloudflare Pages ==="
 
+# The build scripts are pure Python, so they also run under PyPy:
+#   PYTHON=pypy3 ./build.sh
+PYTHON="${PYTHON:-python}"
+
 # Install Python dependencies
 echo "Installing Python dependencies..."
-pip install --quiet markdown
+"$PYTHON" -m pip install --quiet cmarkgfm markdown
+# orjson is optional (no PyPy wheels); the scripts fall back to the json module
+"$PYTHON" -m pip install --quiet orjson || echo "orjson not installed; using json"
 
 # Run Python build scripts (but NOT write_docs.py which generates LLM descriptions)
 echo "Gathering links and metadata..."
-python gather_links.py
+"$PYTHON" gather_links.py
 
 echo "Building colophon page..."
-python build_colophon.py
+"$PYTHON" build_colophon.py
 
 # Convert README.md to index.html using Python's markdown library
 echo "Converting README.md to index.html..."
-python build_index.py
+"$PYTHON" build_index.py
 
 echo "=== Build complete! ==="
@@ -1,40 +1,178 @@
 #!/usr/bin/env python3
+import functools
 import json
+import os
+from operator import itemgetter
 from datetime import datetime
 import html
-from pathlib import Path
 try:
-    import markdown
-except ModuleNotFoundError as exc:  # pragma: no cover - dependency should be installed
-    raise SystemExit(
-        "The 'markdown' package is required to build colophon.html. "
-        "Install it with 'pip install markdown'."
-    ) from exc
-
-
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover - fall back to the standard library
+    orjson = None
+try:
+    import cmarkgfm
+    from cmarkgfm.cmark import Options as CmarkOptions
+except ModuleNotFoundError:  # pragma: no cover - fall back to pure-Python Markdown
+    cmarkgfm = None
+    try:
+        import markdown
+    except ModuleNotFoundError as exc:  # pragma: no cover - dependency should be installed
+        raise SystemExit(
+            "The 'cmarkgfm' or 'markdown' package is required to build colophon.html. "
+            "Install it with 'pip install cmarkgfm'."
+        ) from exc
+
+    # Build the fallback renderer once; constructing it loads every extension.
+    _MD_EXTENSIONS = ["extra", "sane_lists", "nl2br"]
+    try:
+        _MD = markdown.Markdown(
+            extensions=_MD_EXTENSIONS + ["linkify"],
+            output_format="html5",
+        )
+    except ModuleNotFoundError:
+        _MD = markdown.Markdown(extensions=_MD_EXTENSIONS, output_format="html5")
+
+
+# Indexed by month number; index 0 is unused.
+_MONTHS = (
+    "",
+    "January",
+    "February",
+    "March",
+    "April",
+    "May",
+    "June",
+    "July",
+    "August",
+    "September",
+    "October",
+    "November",
+    "December",
+)
+
+@functools.lru_cache(maxsize=8192)
 def format_commit_message(message):
     """Render commit message as HTML with Markdown support."""
 
     escaped = html.escape(message)
-    extensions = ["extra", "sane_lists", "nl2br"]
+    if cmarkgfm is not None:
+        return cmarkgfm.markdown_to_html_with_extensions(
+            escaped,
+            options=CmarkOptions.CMARK_OPT_HARDBREAKS,
+            extensions=["table", "strikethrough"],
+        )
+
+    return _MD.reset().convert(escaped)
+
+
+def format_commit_date(commit_date):
+    """Format an ISO 8601 commit date for display."""
+
+    if not commit_date:
+        return ""
 
     try:
-        md = markdown.Markdown(
-            extensions=extensions + ["linkify"],
-            output_format="html5",
-        )
-    except ModuleNotFoundError:
-        md = markdown.Markdown(extensions=extensions, output_format="html5")
+        dt = datetime.fromisoformat(commit_date)
+    except ValueError:
+        return commit_date
+    # Equivalent to dt.strftime("%B %d, %Y %H:%M") without the locale machinery.
+    return f"{_MONTHS[dt.month]} {dt.day:02d}, {dt.year} {dt.hour:02d}:{dt.minute:02d}"
+
+
+def render_markdown(text):
+    """Render a Markdown document (e.g. tool docs) as HTML."""
+
+    if cmarkgfm is not None:
+        return cmarkgfm.markdown_to_html(text, options=CmarkOptions.CMARK_OPT_UNSAFE)
+    return markdown.markdown(text)
+
+
+def load_json(path):
+    """Load a JSON file, using orjson when it is installed."""
+
+    if orjson is not None:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _render_tool(item, docs_files):
+    """Render the UTF-8 encoded colophon entry for a ``(page_name, page_data)`` item.
+
+    ``docs_files`` is the set of file names in the current directory, used to
+    check for a ``.docs.md`` file without a ``stat`` call per tool.
+    """
+
+    page_name, page_data = item
+    tool_url = f"https://tools.mathspp.com/{page_name.replace('.html', '')}"
+    github_url = f"https://github.com/mathspp/tools/blob/main/{page_name}"
+    raw_commits = page_data.get("commits", [])
+    commit_count = len(raw_commits)
+
+    display_name = html.escape(page_name.replace(".html", ""))
+    page_id = html.escape(page_name)
+    tool_href = html.escape(tool_url)
+    code_href = html.escape(github_url)
+
+    parts = []
+    parts.append(f"""
+            <article class=\"surface tool-entry\" id=\"{page_id}\">
+                <header class=\"tool-entry-header\">
+                    <a class=\"tool-entry-anchor\" href=\"#{page_id}\" aria-label=\"Permalink to {display_name}\">#</a>
+                    <h2 class=\"tool-entry-title\"><a href=\"{tool_href}\">{display_name}</a></h2>
+                    <div class=\"tool-entry-links\">
+                        <a href=\"{code_href}\">View code</a>
+                    </div>
+                </header>
+""")
+
+    docs_file = page_name.replace(".html", ".docs.md")
+    if docs_file in docs_files:
+        try:
+            with open(docs_file, "r", encoding="utf-8") as f:
+                docs_content = f.read()
+            docs_html = render_markdown(docs_content)
+            parts.append('<div class="tool-entry-docs">' + docs_html + "</div>")
+        except Exception as exc:  # pragma: no cover - informational only
+            print(f"Error reading {docs_file}: {exc}")
+
+    parts.append(f"""
+                <details>
+                    <summary>Development history ({commit_count} commit{'s' if commit_count > 1 else ''})</summary>
+""")
 
-    formatted = md.convert(escaped)
-    md.reset()
-    return formatted
+    for commit in reversed(raw_commits):
+        commit_hash = commit.get("hash", "")
+        short_hash = commit_hash[:7] if commit_hash else "unknown"
+        formatted_date = format_commit_date(commit.get("date", ""))
+
+        commit_message = commit.get("message", "")
+        formatted_message = format_commit_message(commit_message)
+        commit_url = f"https://github.com/mathspp/tools/commit/{commit_hash}"
+        safe_commit_url = html.escape(commit_url)
+
+        parts.append(f"""
+                    <div class=\"commit\" id=\"commit-{short_hash}\">
+                        <div>
+                            <a href=\"{safe_commit_url}\" class=\"commit-hash\">{short_hash}</a>
+                            <span class=\"commit-date\">{formatted_date}</span>
+                        </div>
+                        <div class=\"commit-message\">{formatted_message}</div>
+                    </div>
+""")
+
+    parts.append("""
+                </details>
+            </article>
+""")
+
+    return "".join(parts).encode("utf-8")
 
 
 def build_colophon():
     try:
-        with open("gathered_links.json", "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = load_json("gathered_links.json")
     except FileNotFoundError:
         print("Error: gathered_links.json not found. Run gather_links.py first.")
         return
@@ -45,19 +183,29 @@ def build_colophon():
         return
 
     def get_most_recent_date(page_data):
-        commits = page_data.get("commits", [])
-        if not commits:
-            return "0000-00-00T00:00:00"
-        dates = [commit.get("date", "0000-00-00T00:00:00") for commit in commits]
-        return max(dates) if dates else "0000-00-00T00:00:00"
+        # ISO 8601 strings sort chronologically, so no parsing is needed.
+        return max(
+            (
+                commit.get("date", "0000-00-00T00:00:00")
+                for commit in page_data.get("commits", [])
+            ),
+            default="0000-00-00T00:00:00",
+        )
 
-    sorted_pages = sorted(
-        pages.items(), key=lambda item: get_most_recent_date(item[1]), reverse=True
-    )
+    # Decorate-sort-undecorate; sorting on the date alone keeps ties in input order.
+    keyed_pages = [
+        (get_most_recent_date(page_data), page_name, page_data)
+        for page_name, page_data in pages.items()
+    ]
+    keyed_pages.sort(key=itemgetter(0), reverse=True)
+    sorted_pages = [(page_name, page_data) for _, page_name, page_data in keyed_pages]
 
     tool_count = len(sorted_pages)
+    with os.scandir(".") as entries:
+        docs_files = {entry.name for entry in entries if entry.is_file()}
 
-    html_content = f"""<!DOCTYPE html>
+    with open("colophon.html", "wb") as out:
+        out.write(f"""<!DOCTYPE html>
 <html lang=\"en\">
 <head>
     <meta charset=\"UTF-8\">
@@ -73,79 +221,12 @@ def build_colophon():
     </header>
     <main class=\"page-shell content-flow\">
         <section class=\"tool-list\">
-"""
-
-    for page_name, page_data in sorted_pages:
-        tool_url = f"https://tools.mathspp.com/{page_name.replace('.html', '')}"
-        github_url = f"https://github.com/mathspp/tools/blob/main/{page_name}"
-        commits = list(reversed(page_data.get("commits", [])))
-        commit_count = len(commits)
+""".encode("utf-8"))
 
-        display_name = html.escape(page_name.replace(".html", ""))
-        page_id = html.escape(page_name)
-        tool_href = html.escape(tool_url)
-        code_href = html.escape(github_url)
+        for item in sorted_pages:
+            out.write(_render_tool(item, docs_files))
 
-        html_content += f"""
-            <article class=\"surface tool-entry\" id=\"{page_id}\">
-                <header class=\"tool-entry-header\">
-                    <a class=\"tool-entry-anchor\" href=\"#{page_id}\" aria-label=\"Permalink to {display_name}\">#</a>
-                    <h2 class=\"tool-entry-title\"><a href=\"{tool_href}\">{display_name}</a></h2>
-                    <div class=\"tool-entry-links\">
-                        <a href=\"{code_href}\">View code</a>
-                    </div>
-                </header>
-"""
-
-        docs_file = page_name.replace(".html", ".docs.md")
-        if Path(docs_file).exists():
-            try:
-                with open(docs_file, "r", encoding="utf-8") as f:
-                    docs_content = f.read()
-                docs_html = markdown.markdown(docs_content)
-                html_content += '<div class="tool-entry-docs">' + docs_html + "</div>"
-            except Exception as exc:  # pragma: no cover - informational only
-                print(f"Error reading {docs_file}: {exc}")
-
-        html_content += f"""
-                <details>
-                    <summary>Development history ({commit_count} commit{'s' if commit_count > 1 else ''})</summary>
-"""
-
-        for commit in commits:
-            commit_hash = commit.get("hash", "")
-            short_hash = commit_hash[:7] if commit_hash else "unknown"
-            commit_date = commit.get("date", "")
-
-            formatted_date = ""
-            if commit_date:
-                try:
-                    dt = datetime.fromisoformat(commit_date)
-                    formatted_date = dt.strftime("%B %d, %Y %H:%M")
-                except ValueError:
-                    formatted_date = commit_date
-
-            commit_message = commit.get("message", "")
-            formatted_message = format_commit_message(commit_message)
-            commit_url = f"https://github.com/mathspp/tools/commit/{commit_hash}"
-            safe_commit_url = html.escape(commit_url)
-
-            html_content += f"""
-                    <div class=\"commit\" id=\"commit-{short_hash}\">
-                        <div>
-                            <a href=\"{safe_commit_url}\" class=\"commit-hash\">{short_hash}</a>
-                            <span class=\"commit-date\">{formatted_date}</span>
-                        </div>
-                        <div class=\"commit-message\">{formatted_message}</div>
-                    </div>
-"""
-
-        html_content += """
-                </details>
-            </article>
-"""
-
-    html_content += """
+        out.write("""
         </section>
     </main>
     <script>
@@ -164,10 +245,7 @@ def build_colophon():
     </script>
 </body>
 </html>
-"""
-
-    with open("colophon.html", "w", encoding="utf-8") as f:
-        f.write(html_content)
+""".encode("utf-8"))
 
     print("Colophon page built successfully as colophon.html")
 
@@ -3,52 +3,81 @@
 
 from __future__ import annotations
 
+import heapq
 import html
 import json
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
 from typing import Iterable, List, Sequence
 
 try:
-    import markdown
-except ModuleNotFoundError as exc:  # pragma: no cover - dependency should be installed
-    raise SystemExit(
-        "The 'markdown' package is required to build index.html. "
-        "Install it with 'pip install markdown'."
-    ) from exc
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover - fall back to the standard library
+    orjson = None
+try:
+    import cmarkgfm
+    from cmarkgfm.cmark import Options as CmarkOptions
+except ModuleNotFoundError:  # pragma: no cover - fall back to pure-Python Markdown
+    cmarkgfm = None
+    try:
+        import markdown
+    except ModuleNotFoundError as exc:  # pragma: no cover - dependency should be installed
+        raise SystemExit(
+            "The 'cmarkgfm' or 'markdown' package is required to build index.html. "
+            "Install it with 'pip install cmarkgfm'."
+        ) from exc
 
 README_PATH = Path("README.md")
 TOOLS_JSON_PATH = Path("tools.json")
 OUTPUT_PATH = Path("index.html")
 
 
+# Ordinal strings for every possible day of the month ("1st", "2nd", ..., "31st").
+_ORDINALS = tuple(
+    f"{day}{'th' if 10 <= day <= 20 else {1: 'st', 2: 'nd', 3: 'rd'}.get(day % 10, 'th')}"
+    for day in range(32)
+)
+
+
 def _ordinal(value: int) -> str:
     """Return the ordinal suffix for a day value."""
-    if 10 <= value % 100 <= 20:
-        suffix = "th"
-    else:
-        suffix = {1: "st", 2: "nd", 3: "rd"}.get(value % 10, "th")
-    return f"{value}{suffix}"
+    return _ORDINALS[value]
 
 
 def _parse_iso_datetime(value: str | None) -> datetime | None:
     if not value:
         return None
     try:
-        cleaned = value.replace("Z", "+00:00")
-        return datetime.fromisoformat(cleaned)
+        return datetime.fromisoformat(value)
+    except ValueError:
+        pass
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
     except ValueError:
         return None
 
 
+def _render_markdown(text: str) -> str:
+    """Render README Markdown as HTML, keeping raw HTML such as the section markers."""
+    if cmarkgfm is not None:
+        return cmarkgfm.markdown_to_html_with_extensions(
+            text,
+            options=CmarkOptions.CMARK_OPT_UNSAFE | CmarkOptions.CMARK_OPT_FOOTNOTES,
+            extensions=["table", "strikethrough"],
+        )
+    md = markdown.Markdown(extensions=["extra"])
+    return md.convert(text)
+
+
 def _has_distinct_update(tool: dict) -> bool:
     """Return True if the tool has an update distinct from its creation."""
 
-    updated = _parse_iso_datetime(tool.get("updated"))
+    updated = tool.get("_updated_dt")
     if updated is None:
         return False
 
-    created = _parse_iso_datetime(tool.get("created"))
+    created = tool.get("_created_dt")
     if created is None:
         return True
 
@@ -62,6 +91,8 @@ def _format_display_date(dt: datetime) -> str:
 def _load_tools() -> List[dict]:
     if not TOOLS_JSON_PATH.exists():
         return []
+    if orjson is not None:
+        return orjson.loads(TOOLS_JSON_PATH.read_bytes())
     with TOOLS_JSON_PATH.open("r", encoding="utf-8") as fp:
         return json.load(fp)
 
@@ -74,71 +105,57 @@ def _select_recent(
     exclude_slugs: Iterable[str] | None = None,
 ) -> List[dict]:
     excluded = set(exclude_slugs or [])
-    dated_tools = [
-        (tool, _parse_iso_datetime(tool.get(key)))
+    parsed_key = f"_{key}_dt"
+    dated_tools = (
+        (tool, tool.get(parsed_key))
         for tool in tools
-        if tool.get(key)
-    ]
-    dated_tools = [item for item in dated_tools if item[1] is not None]
-    dated_tools.sort(key=lambda item: item[1], reverse=True)
+        if tool.get(parsed_key) is not None and tool.get("slug") not in excluded
+    )
 
     selected: List[dict] = []
-    for tool, parsed_date in dated_tools:
-        if tool.get("slug") in excluded:
-            continue
+    for tool, parsed_date in heapq.nlargest(limit, dated_tools, key=itemgetter(1)):
         entry = tool.copy()
         entry["parsed_date"] = parsed_date
         selected.append(entry)
-        if len(selected) >= limit:
-            break
     return selected
 
 
 def _replace_between_markers(body_html: str, start_marker: str, end_marker: str, replacement: str) -> str:
-    if start_marker not in body_html or end_marker not in body_html:
-        raise RuntimeError(f"Markers '{start_marker}' or '{end_marker}' not found.")
-
-    start_idx = body_html.find(start_marker)
-    end_idx = body_html.find(end_marker, start_idx)
+    before, found_start, rest = body_html.partition(start_marker)
+    _, found_end, after = rest.partition(end_marker)
 
-    if start_idx == -1 or end_idx == -1 or start_idx >= end_idx:
-        raise RuntimeError("Invalid marker positions.")
+    if not found_start or not found_end:
+        if found_start and end_marker in before:
+            raise RuntimeError("Invalid marker positions.")
+        raise RuntimeError(f"Markers '{start_marker}' or '{end_marker}' not found.")
 
-    return (
-        body_html[: start_idx + len(start_marker)]
-        + "\n"
-        + replacement
-        + "\n"
-        + body_html[end_idx:]
-    )
+    return before + start_marker + "\n" + replacement + "\n" + end_marker + after
 
 
 def _render_recent_section(recently_added: Sequence[dict], recently_updated: Sequence[dict]) -> str:
+    def render_item(tool: dict) -> str:
+        slug = tool.get("slug", "")
+        url = tool.get("url", "#")
+        filename = tool.get("filename", "")
+        parsed_date = tool.get("parsed_date")
+        if isinstance(parsed_date, datetime):
+            formatted_date = _format_display_date(parsed_date)
+        else:
+            formatted_date = ""
+
+        # Create colophon link for the date
+        colophon_url = f"https://tools.mathspp.com/colophon#{filename}" if filename else "#"
+        date_html = (
+            f'<span class="recent-date"> — <a href="{colophon_url}">{formatted_date}</a></span>'
+            if formatted_date
+            else ""
+        )
+        return f"        <li><a href=\"{url}\">{slug}</a>{date_html}</li>"
+
     def render_list(tools: Sequence[dict]) -> str:
         if not tools:
             return "        <li class=\"recent-empty\">No entries available.</li>"
-        items = []
-        for tool in tools:
-            slug = tool.get("slug", "")
-            url = tool.get("url", "#")
-            filename = tool.get("filename", "")
-            parsed_date = tool.get("parsed_date")
-            if isinstance(parsed_date, datetime):
-                formatted_date = _format_display_date(parsed_date)
-            else:
-                formatted_date = ""
-
-            # Create colophon link for the date
-            colophon_url = f"https://tools.mathspp.com/colophon#{filename}" if filename else "#"
-            date_html = (
-                f'<span class="recent-date"> — <a href="{colophon_url}">{formatted_date}</a></span>'
-                if formatted_date
-                else ""
-            )
-            items.append(
-                f"        <li><a href=\"{url}\">{slug}</a>{date_html}</li>"
-            )
-        return "\n".join(items)
+        return "\n".join(render_item(tool) for tool in tools)
 
     section_html = f"""
 <section class="surface recent-highlights content-flow">
@@ -162,6 +179,11 @@ def _render_recent_section(recently_added: Sequence[dict], recently_updated: Seq
 
 
 def _render_tools_index(tools: Sequence[dict]) -> str:
+    def render_item(tool: dict) -> str:
+        title = tool.get("title") or tool.get("slug") or "Untitled tool"
+        url = tool.get("url") or f"/{tool.get('slug', '')}"
+        return f"      <li><a href=\"{html.escape(url)}\">{html.escape(title)}</a></li>"
+
     filtered_tools = [tool for tool in tools if tool.get("slug") != "index"]
     sorted_tools = sorted(
         filtered_tools,
@@ -169,14 +191,7 @@ def _render_tools_index(tools: Sequence[dict]) -> str:
     )
 
     if sorted_tools:
-        items = []
-        for tool in sorted_tools:
-            title = tool.get("title") or tool.get("slug") or "Untitled tool"
-            url = tool.get("url") or f"/{tool.get('slug', '')}"
-            items.append(
-                f"      <li><a href=\"{html.escape(url)}\">{html.escape(title)}</a></li>"
-            )
-        list_content = "\n".join(items)
+        list_content = "\n".join(render_item(tool) for tool in sorted_tools)
     else:
         list_content = "      <li class=\"tools-directory-empty\">No tools available.</li>"
 
@@ -196,10 +211,13 @@ def build_index() -> None:
         raise FileNotFoundError("README.md not found")
 
     markdown_content = README_PATH.read_text("utf-8")
-    md = markdown.Markdown(extensions=["extra"])
-    body_html = md.convert(markdown_content)
+    body_html = _render_markdown(markdown_content)
 
     tools = _load_tools()
+    # Parse each tool's dates once; the helpers below read these cached values.
+    for tool in tools:
+        tool["_created_dt"] = _parse_iso_datetime(tool.get("created"))
+        tool["_updated_dt"] = _parse_iso_datetime(tool.get("updated"))
     recently_added = _select_recent(tools, key="created", limit=5)
     added_slugs = [tool.get("slug") for tool in recently_added]
     tools_with_updates = [tool for tool in tools if _has_distinct_update(tool)]
@@ -225,7 +243,8 @@ def build_index() -> None:
 
     wrapped_body = f"<article class=\"content-flow\">\n{body_html}\n</article>"
 
-    full_html = f"""<!DOCTYPE html>
+    with OUTPUT_PATH.open("wb") as out:
+        out.write("""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -235,16 +254,17 @@ def build_index() -> None:
 </head>
 <body>
     <main class="page-shell content-flow">
-{wrapped_body}
+""".encode("utf-8"))
+        out.write(wrapped_body.encode("utf-8"))
+        out.write("""
     </main>
     <footer class="page-footer">
         <p>Built with ❤️, 🤖, and 🐍, by <a href="https://mathspp.com/">Rodrigo Girão Serrão</a></p>
     </footer>
 </body>
 </html>
-"""
+""".encode("utf-8"))
 
-    OUTPUT_PATH.write_text(full_html, "utf-8")
     print("index.html created successfully")
 
 